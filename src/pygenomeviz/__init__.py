@@ -1,6 +1,12 @@
-from pygenomeviz.genbank import Genbank
-from pygenomeviz.genomeviz import GenomeViz
-from pygenomeviz.utils import load_dataset
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+from typing import List as _List
+
+if _TYPE_CHECKING:
+    from pygenomeviz.genbank import Genbank
+    from pygenomeviz.genomeviz import GenomeViz
+    from pygenomeviz.utils import load_dataset
 
 __version__ = "0.1.1"
 
@@ -9,3 +15,22 @@ __all__ = [
     "Genbank",
     "load_dataset",
 ]
+
+# Public object name & module name (Lazy import to reduce CLI startup time)
+_name2module = {
+    "GenomeViz": "pygenomeviz.genomeviz",
+    "Genbank": "pygenomeviz.genbank",
+    "load_dataset": "pygenomeviz.utils",
+}
+
+
+def __getattr__(name: str) -> _Any:
+    """Import public object on first access"""
+    if name in _name2module:
+        return getattr(_import_module(_name2module[name]), name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> _List[str]:
+    """List public objects (Including not yet imported objects)"""
+    return sorted(__all__ + ["__version__"])
@@ -0,0 +1,22 @@
+import hashlib
+from pathlib import Path
+from typing import Union
+
+
+def get_file_fingerprint(file: Union[str, Path]) -> str:
+    """Get file fingerprint from 'absolute path', 'size' & 'modified time'
+
+    Parameters
+    ----------
+    file : Union[str, Path]
+        Target file
+
+    Returns
+    -------
+    fingerprint : str
+        File fingerprint hash string
+    """
+    file = Path(file).resolve()
+    stat = file.stat()
+    key = f"{file}-{stat.st_size}-{stat.st_mtime_ns}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
@@ -7,10 +7,12 @@ import os
 import shutil
 import subprocess as sp
 import sys
-from dataclasses import astuple, dataclass
+from dataclasses import astuple, dataclass, replace
 from pathlib import Path
 from typing import ClassVar, List, Optional, Tuple, Union
 
+import numpy as np
+
 from pygenomeviz import Genbank
 
 
@@ -103,10 +105,11 @@ class Align:
             Genome alignment coord list
         """
         # Prepare data for run MUMmer with multiprocessing
+        genome_fasta_files = self._genome_fasta_files
         mp_data_list: List[Tuple[Path, Path, int]] = []
         for idx in range(0, self.genome_num - 1):
-            fa_file1 = self._genome_fasta_files[idx]
-            fa_file2 = self._genome_fasta_files[idx + 1]
+            fa_file1 = genome_fasta_files[idx]
+            fa_file2 = genome_fasta_files[idx + 1]
             mp_data_list.append((fa_file1, fa_file2, idx))
 
         # Run MUMmer with multiprocessing
@@ -211,6 +214,20 @@ class AlignCoord:
         "REF_NAME",
         "QUERY_NAME",
     ]
+    array_dtype: ClassVar[np.dtype] = np.dtype(
+        [
+            ("ref_start", np.int64),
+            ("ref_end", np.int64),
+            ("query_start", np.int64),
+            ("query_end", np.int64),
+            ("ref_length", np.int64),
+            ("query_length", np.int64),
+            ("identity", np.float64),
+            ("ref_name", object),
+            ("query_name", object),
+            ("is_inverted", np.bool_),
+        ]
+    )
 
     @property
     def ref_strand(self) -> int:
@@ -357,5 +374,68 @@ class AlignCoord:
         for ac in align_coords:
             rlen, qlen, ident = ac.ref_length, ac.query_length, ac.identity
             if (rlen >= min_length and qlen >= min_length) and ident >= min_identity:
-                filtered_align_coords.append(AlignCoord(*astuple(ac)))
+                filtered_align_coords.append(replace(ac))
         return filtered_align_coords
+
+    @staticmethod
+    def filter_arrays(
+        align_coords_array: np.ndarray,
+        min_length: int = 0,
+        min_identity: float = 0.0,
+    ) -> np.ndarray:
+        """Filter align coords structured array with 'length' & 'identity'
+
+        Parameters
+        ----------
+        align_coords_array : np.ndarray
+            Align coords structured array (`AlignCoord.to_arrays()` result)
+        min_length : int, optional
+            Min length filtering threshold
+        min_identity : float, optional
+            Min identity filtering threshold
+
+        Returns
+        -------
+        filtered_align_coords_array : np.ndarray
+            Filtered align coords structured array
+        """
+        arr = align_coords_array
+        is_target = (
+            (arr["ref_length"] >= min_length)
+            & (arr["query_length"] >= min_length)
+            & (arr["identity"] >= min_identity)
+        )
+        return arr[is_target]
+
+    @staticmethod
+    def to_arrays(align_coords: List[AlignCoord]) -> np.ndarray:
+        """Convert align coord list to structured array
+
+        Parameters
+        ----------
+        align_coords : List[AlignCoord]
+            Align coord list
+
+        Returns
+        -------
+        align_coords_array : np.ndarray
+            Align coords structured array (dtype=`AlignCoord.array_dtype`)
+        """
+        return np.array(
+            [
+                (
+                    ac.ref_start,
+                    ac.ref_end,
+                    ac.query_start,
+                    ac.query_end,
+                    ac.ref_length,
+                    ac.query_length,
+                    ac.identity,
+                    ac.ref_name,
+                    ac.query_name,
+                    ac.is_inverted,
+                )
+                for ac in align_coords
+            ],
+            dtype=AlignCoord.array_dtype,
+        )
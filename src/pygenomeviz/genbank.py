@@ -1,16 +1,45 @@
 import bz2
 import gzip
+import os
+import pickle
+import re
 import zipfile
-from functools import lru_cache
+from collections import defaultdict
+from importlib.util import find_spec
 from io import TextIOWrapper
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import Bio
 import numpy as np
-from Bio import SeqIO, SeqUtils
-from Bio.SeqFeature import FeatureLocation, Seq, SeqFeature
+from Bio import SeqIO
+from Bio.Data.IUPACData import ambiguous_dna_complement
+from Bio.SeqFeature import FeatureLocation, SeqFeature
 from Bio.SeqRecord import SeqRecord
 
+from pygenomeviz import __version__
+from pygenomeviz._fingerprint import get_file_fingerprint
+
+# Optional packages are imported on first use (To reduce import time).
+# Flag is set to False if package is installed but failed to import.
+_RAPIDGZIP_AVAILABLE = find_spec("rapidgzip") is not None
+_INDEXED_BZIP2_AVAILABLE = find_spec("indexed_bzip2") is not None
+
+_FUZZY_POSITION_REGEX = re.compile(r"[<>]")
+# IUPAC ambiguous DNA complement translation table (uppercase & lowercase)
+# U is complemented as T (U -> A), so reverse complement is always DNA
+_DNA_COMPLEMENT = {**ambiguous_dna_complement, "U": "A"}
+_COMPLEMENT_TABLE = bytes.maketrans(
+    "".join(_DNA_COMPLEMENT.keys()).encode()
+    + "".join(_DNA_COMPLEMENT.keys()).lower().encode(),
+    "".join(_DNA_COMPLEMENT.values()).encode()
+    + "".join(_DNA_COMPLEMENT.values()).lower().encode(),
+)
+# Set bit count of each byte value
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+# Mask for leading N(=index) bits of byte
+_LEADING_BITS_MASK = np.array([(0xFF << (8 - i)) & 0xFF for i in range(8)], np.uint8)
+
 
 class Genbank:
     """Genbank Class"""
@@ -22,6 +51,7 @@ class Genbank:
         reverse: bool = False,
         min_range: Optional[int] = None,
         max_range: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         """
         Parameters
@@ -37,10 +67,17 @@ class Genbank:
             Min range to be extracted (Default: `0`)
         max_range : Optional[int], optional
             Max range to be extracted (Default: `genome length`)
+        cache_dir : Optional[Union[str, Path]], optional
+            If set, parsed genbank records are cached in this directory
+            and reused while genbank file path, size & modified time are unchanged
         """
         self._gbk_source = gbk_source
         self._name = name
-        self._records = self._parse_gbk_source(gbk_source)
+        if cache_dir is not None and isinstance(gbk_source, (str, Path)):
+            self._records = self._load_cached_records(gbk_source, cache_dir)
+        else:
+            self._records = self._parse_gbk_source(gbk_source)
+        self._reverse_records: Optional[List[SeqRecord]] = None
         self.reverse = reverse
         self.min_range = 0 if min_range is None else min_range
         self.max_range = self.full_genome_length if max_range is None else max_range
@@ -69,10 +106,10 @@ class Genbank:
         # Parse compressed file
         if isinstance(gbk_source, (str, Path)):
             if Path(gbk_source).suffix == ".gz":
-                with gzip.open(gbk_source, mode="rt") as f:
+                with _open_gzfile(gbk_source) as f:
                     return list(SeqIO.parse(f, "genbank"))
             elif Path(gbk_source).suffix == ".bz2":
-                with bz2.open(gbk_source, mode="rt") as f:
+                with _open_bzfile(gbk_source) as f:
                     return list(SeqIO.parse(f, "genbank"))
             elif Path(gbk_source).suffix == ".zip":
                 with zipfile.ZipFile(gbk_source) as zip:
@@ -81,6 +118,71 @@ class Genbank:
         # Parse no compressed file or TextIOWrapper
         return list(SeqIO.parse(gbk_source, "genbank"))
 
+    def _join_records_seq(self, records: List[SeqRecord], reverse: bool) -> str:
+        """Join records sequence
+
+        If reverse is True, joined sequence is reverse complemented at once
+        (Reverse complement records are not required for sequence).
+        U is complemented as T (e.g. `ACGU` -> `ACGT`), which may differ from
+        `records` sequence reverse complemented as RNA by old Biopython versions.
+
+        Parameters
+        ----------
+        records : List[SeqRecord]
+            Genbank SeqRecords
+        reverse : bool
+            If True, reverse complement joined sequence
+
+        Returns
+        -------
+        joined_seq : str
+            Joined sequence
+        """
+        joined_seq = b"".join(bytes(r.seq) for r in records)
+        if reverse:
+            joined_seq = joined_seq.translate(_COMPLEMENT_TABLE)[::-1]
+        return joined_seq.decode()
+
+    def _load_cached_records(
+        self, gbk_file: Union[str, Path], cache_dir: Union[str, Path]
+    ) -> List[SeqRecord]:
+        """Load genbank records from cache (Parse & cache if not cached)
+
+        Cache is keyed by genbank file fingerprint, Biopython & pyGenomeViz versions.
+        If cache file is broken, genbank file is parsed again and cache is overwritten.
+
+        Parameters
+        ----------
+        gbk_file : Union[str, Path]
+            Genbank file
+        cache_dir : Union[str, Path]
+            Cache directory
+
+        Returns
+        -------
+        List[SeqRecord]
+            Genbank SeqRecords
+        """
+        fingerprint = get_file_fingerprint(gbk_file)
+        version = f"biopython{Bio.__version__}_pygenomeviz{__version__}"
+        cache_file = Path(cache_dir) / f"{fingerprint}_{version}.pkl"
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    return pickle.load(f)
+            except Exception:
+                # Truncated, corrupt or incompatible cache file
+                pass
+
+        records = self._parse_gbk_source(gbk_file)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to temporary file & rename to avoid reading incomplete cache
+        tmp_cache_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_cache_file, "wb") as f:
+            pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_cache_file, cache_file)
+        return records
+
     @property
     def name(self) -> str:
         """Name"""
@@ -97,39 +199,98 @@ class Genbank:
         else:
             raise NotImplementedError()
 
+    @property
+    def reverse(self) -> bool:
+        """If True, reverse complement genome is used"""
+        return self._reverse
+
+    @reverse.setter
+    def reverse(self, reverse: bool) -> None:
+        """Set reverse & reset caches derived from forward/reverse genome"""
+        self._reverse = reverse
+        self._joined_seq = self._join_records_seq(self._records, reverse)
+        self._type2features_list: Optional[List[Dict[str, List[SeqFeature]]]] = None
+        self._base_counts_cache: Optional[Tuple[Tuple[int, int], np.ndarray]] = None
+        self._gc_packed_bits_cache: Optional[Tuple[Tuple[int, int], Any]] = None
+        self._extract_features_cache: Dict[Tuple, List[Tuple]] = {}
+
     @property
     def records(self) -> List[SeqRecord]:
         """Genbank records"""
         if self.reverse:
-            return list(reversed([r.reverse_complement() for r in self._records]))
+            if self._reverse_records is None:
+                self._reverse_records = list(
+                    reversed([r.reverse_complement() for r in self._records])
+                )
+            return self._reverse_records
         else:
             return self._records
 
+    @property
+    def _record_type2features(self) -> List[Dict[str, List[SeqFeature]]]:
+        """Feature type & features dict of each record"""
+        if self._type2features_list is None:
+            self._type2features_list = []
+            for record in self.records:
+                type2features: Dict[str, List[SeqFeature]] = defaultdict(list)
+                for f in record.features:
+                    type2features[f.type].append(f)
+                self._type2features_list.append(dict(type2features))
+        return self._type2features_list
+
     @property
     def full_genome_length(self) -> int:
         """Full genome sequence length"""
-        return len(self.full_genome_seq)
+        return len(self._joined_seq)
 
     @property
     def genome_length(self) -> int:
         """Range genome sequence length"""
-        return len(self.genome_seq)
+        return self.max_range - self.min_range
 
     @property
     def full_genome_seq(self) -> str:
         """Full genome sequence"""
-        return "".join(str(r.seq) for r in self.records)
+        return self._joined_seq
 
     @property
     def genome_seq(self) -> str:
         """Range genome sequence"""
-        seq = "".join(str(r.seq) for r in self.records)
-        return seq[self.min_range : self.max_range]
+        return self._joined_seq[self.min_range : self.max_range]
+
+    @property
+    def _base_counts(self) -> np.ndarray:
+        """Range genome ASCII code (uppercase) counts array (256 length)
+
+        Recalculated if range is changed.
+        """
+        genome_range = (self.min_range, self.max_range)
+        cache = self._base_counts_cache
+        if cache is None or cache[0] != genome_range:
+            cache = (genome_range, _count_bases(self.genome_seq))
+            self._base_counts_cache = cache
+        return cache[1]
+
+    @property
+    def _gc_packed_bits(
+        self,
+    ) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        """Range genome G & C packed bits (Recalculated if range is changed)"""
+        genome_range = (self.min_range, self.max_range)
+        cache = self._gc_packed_bits_cache
+        if cache is None or cache[0] != genome_range:
+            cache = (genome_range, _pack_gc_bits(self.genome_seq))
+            self._gc_packed_bits_cache = cache
+        return cache[1]
 
-    @lru_cache(maxsize=None)
     def calc_genome_gc_content(self) -> float:
         """Calculate genome GC content"""
-        return SeqUtils.GC(self.genome_seq)
+        base_counts = self._base_counts
+        seq_length = base_counts.sum()
+        if seq_length == 0:
+            return 0.0
+        gc_count = base_counts[ord("G")] + base_counts[ord("C")]
+        return float(gc_count * 100.0 / seq_length)
 
     def calc_gc_skew(
         self,
@@ -150,29 +311,18 @@ class Genbank:
         gc_skew_result_tuple : Tuple[np.ndarray, np.ndarray]
             Position list & GC skew list
         """
-        pos_list, gc_skew_list = [], []
-        seq = self.genome_seq
+        seq_length = self.genome_length
         if window_size is None:
-            window_size = int(len(seq) / 500)
+            window_size = int(seq_length / 500)
         if step_size is None:
-            step_size = int(len(seq) / 1000)
-        pos_list = list(range(0, len(seq), step_size)) + [len(seq)]
-        for pos in pos_list:
-            window_start_pos = pos - int(window_size / 2)
-            window_end_pos = pos + int(window_size / 2)
-            window_start_pos = 0 if window_start_pos < 0 else window_start_pos
-            window_end_pos = len(seq) if window_end_pos > len(seq) else window_end_pos
-
-            subseq = seq[window_start_pos:window_end_pos]
-            g = subseq.count("G") + subseq.count("g")
-            c = subseq.count("C") + subseq.count("c")
-            try:
-                skew = (g - c) / float(g + c)
-            except ZeroDivisionError:
-                skew = 0.0
-            gc_skew_list.append(skew)
+            step_size = int(seq_length / 1000)
+        pos, g, c = _calc_window_gc_counts(
+            self._gc_packed_bits, seq_length, window_size, step_size
+        )
+        gc = g + c
+        gc_skew = np.divide(g - c, gc, out=np.zeros(len(gc)), where=gc > 0)
 
-        return (np.array(pos_list), np.array(gc_skew_list))
+        return (pos, gc_skew)
 
     def calc_gc_content(
         self,
@@ -193,23 +343,24 @@ class Genbank:
         gc_content_result_tuple : Tuple[np.ndarray, np.ndarray]
             Position list & GC content list
         """
-        pos_list, gc_content_list = [], []
-        seq = self.genome_seq
+        seq_length = self.genome_length
         if window_size is None:
-            window_size = int(len(seq) / 500)
+            window_size = int(seq_length / 500)
         if step_size is None:
-            step_size = int(len(seq) / 1000)
-        pos_list = list(range(0, len(seq), step_size)) + [len(seq)]
-        for pos in pos_list:
-            window_start_pos = pos - int(window_size / 2)
-            window_end_pos = pos + int(window_size / 2)
-            window_start_pos = 0 if window_start_pos < 0 else window_start_pos
-            window_end_pos = len(seq) if window_end_pos > len(seq) else window_end_pos
-
-            subseq = seq[window_start_pos:window_end_pos]
-            gc_content_list.append(SeqUtils.GC(subseq))
-
-        return (np.array(pos_list), np.array(gc_content_list))
+            step_size = int(seq_length / 1000)
+        pos, g, c = _calc_window_gc_counts(
+            self._gc_packed_bits, seq_length, window_size, step_size
+        )
+        starts, ends = _calc_window_range(pos, window_size, seq_length)
+        window_length = ends - starts
+        gc_content = np.divide(
+            (g + c) * 100.0,
+            window_length,
+            out=np.zeros(len(pos)),
+            where=window_length > 0,
+        )
+
+        return (pos, gc_content)
 
     def extract_features(
         self,
@@ -237,60 +388,118 @@ class Genbank:
         features : List[SeqFeature]
             Extracted features
         """
-        extract_features = []
         min_range, max_range = self.min_range, self.max_range
+        cache_key = (
+            feature_type,
+            target_strand,
+            fix_position,
+            allow_partial,
+            min_range,
+            max_range,
+        )
+        if cache_key not in self._extract_features_cache:
+            self._extract_features_cache[cache_key] = self._extract_feature_params(
+                feature_type, target_strand, fix_position, allow_partial
+            )
+        feature_params = self._extract_features_cache[cache_key]
+        # Create new features for each call, so that cached result is not modified
+        return [
+            SeqFeature(
+                location=FeatureLocation(start, end, strand),
+                type=ftype,
+                qualifiers=qualifiers,
+            )
+            for start, end, strand, ftype, qualifiers in feature_params
+        ]
+
+    def _extract_feature_params(
+        self,
+        feature_type: str,
+        target_strand: Optional[int],
+        fix_position: bool,
+        allow_partial: bool,
+    ) -> List[Tuple[int, int, Optional[int], str, Dict[str, Any]]]:
+        """Extract feature parameters (Used by `extract_features()`)
+
+        Returns
+        -------
+        feature_params : List[Tuple[int, int, Optional[int], str, Dict[str, Any]]]
+            Start, end, strand, type & qualifiers of extracted features
+        """
+        min_range, max_range = self.min_range, self.max_range
+        feature_params = []
         base_len = 0
-        for record in self.records:
-            features = [f for f in record.features if f.type == feature_type]
-            for f in features:
-                if feature_type == "CDS":
-                    # Exclude pseudogene (no translated gene)
-                    translation = f.qualifiers.get("translation", [None])[0]
-                    if translation is None:
-                        continue
-                if f.strand == -1:
-                    # Handle rare case (complement & join)
-                    # Found in NC_00913 protein_id=NP_417367.1
-                    start = self._to_int(f.location.parts[-1].start) + base_len
-                    end = self._to_int(f.location.parts[0].end) + base_len
-                else:
-                    start = self._to_int(f.location.parts[0].start) + base_len
-                    end = self._to_int(f.location.parts[-1].end) + base_len
-                # Restrict features in range
-                if allow_partial:
-                    if (
-                        not min_range <= start <= max_range
-                        and not min_range <= end <= max_range
-                    ):
-                        # Ignore completely out of range features
-                        continue
-                    # If partially within range, fix position to within range
-                    if start <= min_range <= end <= max_range:
-                        start = min_range
-                    if min_range <= start <= max_range <= end:
-                        end = max_range
-                else:
-                    if not min_range <= start <= end <= max_range:
-                        # Ignore out of range features
-                        continue
-                # Extract only target strand feature
-                if target_strand is not None and f.strand != target_strand:
-                    continue
-                # Fix start & end position by min_range
-                if fix_position:
-                    start -= min_range
-                    end -= min_range
-
-                extract_features.append(
-                    SeqFeature(
-                        location=FeatureLocation(start, end, f.strand),
-                        type=f.type,
-                        qualifiers=f.qualifiers,
-                    ),
+        for record, type2features in zip(self.records, self._record_type2features):
+            features = type2features.get(feature_type, [])
+            if feature_type == "CDS":
+                # Exclude pseudogene (no translated gene)
+                features = [
+                    f
+                    for f in features
+                    if f.qualifiers.get("translation", [None])[0] is not None
+                ]
+            # Handle rare case (complement & join) in reverse strand
+            # Found in NC_00913 protein_id=NP_417367.1
+            starts = np.fromiter(
+                (
+                    _to_int(f.location.parts[-1 if f.strand == -1 else 0].start)
+                    for f in features
+                ),
+                dtype=np.int64,
+                count=len(features),
+            )
+            ends = np.fromiter(
+                (
+                    _to_int(f.location.parts[0 if f.strand == -1 else -1].end)
+                    for f in features
+                ),
+                dtype=np.int64,
+                count=len(features),
+            )
+            starts += base_len
+            ends += base_len
+            # Restrict features in range
+            if allow_partial:
+                # Ignore completely out of range features
+                is_target = ((min_range <= starts) & (starts <= max_range)) | (
+                    (min_range <= ends) & (ends <= max_range)
+                )
+                # If partially within range, fix position to within range
+                starts = np.where(
+                    (starts <= min_range) & (min_range <= ends) & (ends <= max_range),
+                    min_range,
+                    starts,
+                )
+                ends = np.where(
+                    (min_range <= starts) & (starts <= max_range) & (max_range <= ends),
+                    max_range,
+                    ends,
+                )
+            else:
+                # Ignore out of range features
+                is_target = (
+                    (min_range <= starts) & (starts <= ends) & (ends <= max_range)
+                )
+            # Extract only target strand feature
+            if target_strand is not None:
+                is_target &= np.fromiter(
+                    (f.strand == target_strand for f in features),
+                    dtype=bool,
+                    count=len(features),
+                )
+            # Fix start & end position by min_range
+            if fix_position:
+                starts -= min_range
+                ends -= min_range
+
+            for idx in np.nonzero(is_target)[0]:
+                f = features[idx]
+                feature_params.append(
+                    (int(starts[idx]), int(ends[idx]), f.strand, f.type, f.qualifiers)
                 )
             base_len += len(record.seq)
 
-        return extract_features
+        return feature_params
 
     def write_cds_fasta(
         self,
@@ -305,29 +514,26 @@ class Genbank:
             CDS fasta file
         """
         features = self.extract_features("CDS", None, False, allow_partial)
-        cds_seq_records: List[SeqRecord] = []
-        for idx, feature in enumerate(features, 1):
-            qualifiers = feature.qualifiers
-            protein_id = qualifiers.get("protein_id", [None])[0]
-            product = qualifiers.get("product", [""])[0]
-            translation = qualifiers.get("translation", [None])[0]
-
-            start = self._to_int(feature.location.start)
-            end = self._to_int(feature.location.end)
-            strand = "-" if feature.strand == -1 else "+"
-
-            location_id = f"|{start}_{end}_{strand}|"
-            if protein_id is None:
-                seq_id = f"GENE{idx:06d}{location_id}"
-            else:
-                seq_id = f"GENE{idx:06d}_{protein_id}{location_id}"
-
-            cds_seq_record = SeqRecord(
-                seq=Seq(translation), id=seq_id, description=product
-            )
-            cds_seq_records.append(cds_seq_record)
+        with open(fasta_outfile, "w", buffering=1 << 20) as f:
+            for idx, feature in enumerate(features, 1):
+                qualifiers = feature.qualifiers
+                protein_id = qualifiers.get("protein_id", [None])[0]
+                product = qualifiers.get("product", [""])[0]
+                translation = qualifiers.get("translation", [None])[0]
+
+                start = int(feature.location.start)
+                end = int(feature.location.end)
+                strand = "-" if feature.strand == -1 else "+"
+
+                location_id = f"|{start}_{end}_{strand}|"
+                if protein_id is None:
+                    seq_id = f"GENE{idx:06d}{location_id}"
+                else:
+                    seq_id = f"GENE{idx:06d}_{protein_id}{location_id}"
 
-        SeqIO.write(cds_seq_records, fasta_outfile, "fasta-2line")
+                # Write as 'fasta-2line' format
+                title = f"{seq_id} {product}" if product else seq_id
+                f.write(f">{title}\n{translation}\n")
 
     def write_genome_fasta(
         self,
@@ -340,10 +546,161 @@ class Genbank:
         outfile : Union[str, Path]
             Output genome fasta file
         """
-        write_seq = self.genome_seq
-        with open(outfile, "w") as f:
-            f.write(f">{self.name}\n{write_seq}\n")
+        seq = self.genome_seq
+        with open(outfile, "w", buffering=1 << 20) as f:
+            f.write(f">{self.name}\n")
+            # Write sequence in 80 characters per line
+            for i in range(0, len(seq), 80):
+                f.write(seq[i : i + 80] + "\n")
+
+
+def _open_gzfile(gz_file: Union[str, Path]) -> TextIOWrapper:
+    """Open gzip file in text mode
+
+    Decompressed in parallel if rapidgzip is installed, otherwise gzip is used.
+    """
+    global _RAPIDGZIP_AVAILABLE
+    if _RAPIDGZIP_AVAILABLE:
+        try:
+            import rapidgzip
+        except ImportError:
+            _RAPIDGZIP_AVAILABLE = False
+        else:
+            return TextIOWrapper(rapidgzip.open(str(gz_file), parallelization=0))
+    return gzip.open(gz_file, mode="rt")
+
 
-    def _to_int(self, value: Any) -> int:
-        """Convert to int (Required for AbstractPostion|ExactPostion)"""
-        return int(str(value).replace("<", "").replace(">", ""))
+def _open_bzfile(bz_file: Union[str, Path]) -> TextIOWrapper:
+    """Open bz2 file in text mode
+
+    Decompressed in parallel if indexed_bzip2 is installed, otherwise bz2 is used.
+    """
+    global _INDEXED_BZIP2_AVAILABLE
+    if _INDEXED_BZIP2_AVAILABLE:
+        try:
+            import indexed_bzip2
+        except ImportError:
+            _INDEXED_BZIP2_AVAILABLE = False
+        else:
+            return TextIOWrapper(indexed_bzip2.open(str(bz_file), parallelization=0))
+    return bz2.open(bz_file, mode="rt")
+
+
+def _to_int(value: Any) -> int:
+    """Convert to int (Required for AbstractPostion|ExactPostion)"""
+    if isinstance(value, int):
+        return int(value)
+    return int(_FUZZY_POSITION_REGEX.sub("", str(value)))
+
+
+def _count_bases(seq: str, chunk_size: int = 1 << 20) -> np.ndarray:
+    """Count uppercase ASCII codes of sequence
+
+    Counted by chunk, because np.bincount copies input to intp array.
+
+    Parameters
+    ----------
+    seq : str
+        Sequence
+    chunk_size : int, optional
+        Chunk size to be counted at once
+
+    Returns
+    -------
+    base_counts : np.ndarray
+        ASCII code counts array (256 length)
+    """
+    arr = _encode_upper_seq(seq)
+    base_counts = np.zeros(256, dtype=np.int64)
+    for i in range(0, len(arr), chunk_size):
+        base_counts += np.bincount(arr[i : i + chunk_size], minlength=256)
+    return base_counts
+
+
+def _calc_window_range(
+    pos: np.ndarray, window_size: int, seq_length: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate sliding window start & end positions clipped within sequence"""
+    starts = np.clip(pos - int(window_size / 2), 0, seq_length)
+    ends = np.clip(pos + int(window_size / 2), 0, seq_length)
+    return starts, ends
+
+
+def _calc_window_gc_counts(
+    gc_packed_bits: Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]],
+    seq_length: int,
+    window_size: int,
+    step_size: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate G & C counts in sliding window
+
+    G & C are counted by popcount of bit-packed sequence.
+
+    Parameters
+    ----------
+    gc_packed_bits : Tuple[...]
+        G & C packed bits of sequence (`_pack_gc_bits()` result)
+    seq_length : int
+        Sequence length
+    window_size : int
+        Window size
+    step_size : int
+        Step size
+
+    Returns
+    -------
+    pos, g_count, c_count : Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Window center position, G count, C count
+    """
+    pos = np.append(np.arange(0, seq_length, step_size), seq_length)
+    starts, ends = _calc_window_range(pos, window_size, seq_length)
+    g_count, c_count = [
+        _count_bits_before(bits, cum_counts, ends)
+        - _count_bits_before(bits, cum_counts, starts)
+        for bits, cum_counts in gc_packed_bits
+    ]
+    return pos, g_count, c_count
+
+
+def _pack_gc_bits(
+    seq: str,
+) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """Pack G & C (case-insensitive) positions of sequence into bits
+
+    Each base is packed into 1 bit (8 bases per byte), and set bit counts are
+    accumulated per byte.
+
+    Parameters
+    ----------
+    seq : str
+        Sequence
+
+    Returns
+    -------
+    (g_bits, g_cum_counts), (c_bits, c_cum_counts) : Tuple[...]
+        G & C packed bits and set bit cumulative counts before each byte
+    """
+    arr = _encode_upper_seq(seq)
+    packed_bits_list = []
+    for base in ("G", "C"):
+        # Pad 1 byte to be indexed by sequence length position
+        bits = np.append(np.packbits(arr == ord(base)), np.uint8(0))
+        cum_counts = np.zeros(len(bits), dtype=np.int64)
+        np.cumsum(_POPCOUNT_TABLE[bits[:-1]], dtype=np.int64, out=cum_counts[1:])
+        packed_bits_list.append((bits, cum_counts))
+    g_packed_bits, c_packed_bits = packed_bits_list
+    return g_packed_bits, c_packed_bits
+
+
+def _count_bits_before(
+    bits: np.ndarray, cum_counts: np.ndarray, pos: np.ndarray
+) -> np.ndarray:
+    """Count set bits before each position of packed bits"""
+    byte_idx, bit_idx = pos >> 3, pos & 7
+    partial_bits = bits[byte_idx] & _LEADING_BITS_MASK[bit_idx]
+    return cum_counts[byte_idx] + _POPCOUNT_TABLE[partial_bits]
+
+
+def _encode_upper_seq(seq: str) -> np.ndarray:
+    """Encode sequence to uppercase ASCII code uint8 array"""
+    return np.frombuffer(seq.upper().encode("ascii"), dtype=np.uint8)
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib import colors, gridspec
 from matplotlib.colorbar import ColorbarBase
 from matplotlib.figure import Axes, Figure
@@ -281,6 +282,90 @@ class GenomeViz:
             )
         )
 
+    def add_links(
+        self,
+        track_name1: str,
+        track_name2: str,
+        link_coords: Union[np.ndarray, Sequence[Tuple[int, int, int, int]]],
+        normal_color: str = "grey",
+        inverted_color: str = "red",
+        alpha: float = 0.8,
+        v: Optional[Sequence[float]] = None,
+        vmin: float = 0,
+        vmax: float = 100,
+        curve: bool = False,
+        size_ratio: float = 1.0,
+        patch_kws: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Add multiple link data between two tracks to link track at once
+
+        Parameters
+        ----------
+        track_name1 : str
+            Track name1
+        track_name2 : str
+            Track name2
+        link_coords : Union[np.ndarray, Sequence[Tuple[int, int, int, int]]]
+            Link coordinates (start1, end1, start2, end2) array (shape=`(N, 4)`)
+        normal_color : str, optional
+            Normal link color
+        inverted_color : str, optional
+            Inverted link color
+        alpha : float, optional
+            Color transparency
+        v : Optional[Sequence[float]], optional
+            Values for color interpolation (length=`N`)
+        vmin : float, optional
+            Min value for color interpolation
+        vmax : float, optional
+            Max value for color interpolation
+        curve : bool, optional
+            If True, bezier curve link is plotted
+        size_ratio : float, optional
+            Link size ratio to track
+        patch_kws : Optional[Dict[str, Any]], optional
+            Optional keyword arguments to pass to link Patch object.
+            See https://matplotlib.org/stable/api/_as_gen/matplotlib.patches.Patch.html
+            for detailed parameters.
+        """
+        link_track = self._get_link_track(track_name1, track_name2)
+        link_coords = np.asarray(link_coords, dtype=np.int64).reshape(-1, 4)
+        tracks = [t.name for t in self.get_tracks()]
+        if tracks.index(track_name1) < tracks.index(track_name2):
+            above_track_name, below_track_name = track_name1, track_name2
+        else:
+            above_track_name, below_track_name = track_name2, track_name1
+            link_coords = link_coords[:, [2, 3, 0, 1]]
+        if v is None:
+            v_list: List[Optional[float]] = [None] * len(link_coords)
+        else:
+            v_list = np.asarray(v, dtype=float).tolist()
+            if len(v_list) != len(link_coords):
+                err_msg = f"Length of v ({len(v_list)}) must be same as "
+                err_msg += f"length of link_coords ({len(link_coords)})."
+                raise ValueError(err_msg)
+
+        for (start1, end1, start2, end2), link_v in zip(link_coords.tolist(), v_list):
+            link_track.add_link(
+                Link(
+                    above_track_name,
+                    start1,
+                    end1,
+                    below_track_name,
+                    start2,
+                    end2,
+                    normal_color,
+                    inverted_color,
+                    alpha,
+                    link_v,
+                    vmin,
+                    vmax,
+                    curve,
+                    size_ratio,
+                    patch_kws,
+                )
+            )
+
     def get_track(self, track_name: str) -> Track:
         """Get track by name
 
@@ -397,6 +482,7 @@ class GenomeViz:
 
         # Plot each track
         plot_length_thr = max_track_size * self.plot_size_thr
+        track_name2offset = self._track_name2offset
         for idx, track in enumerate(self.get_tracks(subtrack=True)):
             # Create new track subplot
             xlim, ylim = (0, max_track_size), track.ylim
@@ -432,13 +518,14 @@ class GenomeViz:
                 pass
 
             elif isinstance(track, LinkTrack):
+                target_links = []
                 for link in track.links:
                     # Don't plot too small link (To reduce drawing time)
                     length1, length2 = link.track_length1, link.track_length2
                     if 0 < length1 < plot_length_thr or 0 < length2 < plot_length_thr:
                         continue
-                    link = link.add_offset(self._track_name2offset)
-                    link.plot_link(ax, ylim)
+                    target_links.append(link)
+                Link.plot_links(ax, target_links, track_name2offset, ylim)
 
             elif isinstance(track, TickTrack):
                 if self.tick_style == "axis":
@@ -2,13 +2,30 @@ from __future__ import annotations
 
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from matplotlib import colors
+from matplotlib.collections import PathCollection
 from matplotlib.figure import Axes
 from matplotlib.patches import PathPatch
 from matplotlib.path import Path
 
+LINE_PATH_CODES = [Path.MOVETO] + [Path.LINETO] * 4
+CURVE_PATH_CODES = [
+    Path.MOVETO,
+    Path.LINETO,
+    Path.CURVE4,
+    Path.CURVE4,
+    Path.LINETO,
+    Path.LINETO,
+    Path.CURVE4,
+    Path.CURVE4,
+    Path.LINETO,
+]
+
 
 @dataclass
 class Link:
@@ -123,14 +140,7 @@ class Link:
             rgba = colors.to_rgba(color, alpha=self.alpha)
             return colors.to_hex(rgba, keep_alpha=True)
         else:
-
-            def to_nearly_white(color: str, nearly_value: float = 0.1) -> str:
-                """Convert target color to nearly white"""
-                cmap = colors.LinearSegmentedColormap.from_list("m", ("white", color))
-                return colors.to_hex(cmap(nearly_value))
-
-            nearly_white = to_nearly_white(color)
-            cmap = colors.LinearSegmentedColormap.from_list("m", (nearly_white, color))
+            cmap = _get_interpolation_cmap(color)
             norm = colors.Normalize(vmin=self.vmin, vmax=self.vmax)
             norm_value = norm(self.v)
             return colors.to_hex(cmap(norm_value, alpha=self.alpha), keep_alpha=True)
@@ -148,6 +158,99 @@ class Link:
         track_link_length2 = self.track_end2 - self.track_start2
         return track_link_length1 * track_link_length2 < 0
 
+    @staticmethod
+    def plot_links(
+        ax: Axes,
+        links: List[Link],
+        track_name2offset: Dict[str, int],
+        ylim: Tuple[float, float] = (-1.0, 1.0),
+    ) -> None:
+        """Plot links at once
+
+        Each consecutive run of links without `patch_kws` is plotted as a single
+        PathCollection to reduce drawing time. Links with `patch_kws` are plotted
+        one by one. Links are drawn in the order they were added.
+
+        Parameters
+        ----------
+        ax : Axes
+            Matplotlib axes object to be plotted
+        links : List[Link]
+            Links to be plotted
+        track_name2offset : Dict[str, int]
+            Track name & offset dict
+        ylim: Tuple[flaot, float], optional
+            Min-Max y coordinatess
+        """
+        for has_patch_kws, run_links in groupby(
+            links, key=lambda link: link.patch_kws is not None
+        ):
+            if has_patch_kws:
+                for link in run_links:
+                    link.add_offset(track_name2offset).plot_link(ax, ylim)
+            else:
+                Link._plot_link_collection(ax, list(run_links), track_name2offset, ylim)
+
+    @staticmethod
+    def _plot_link_collection(
+        ax: Axes,
+        links: List[Link],
+        track_name2offset: Dict[str, int],
+        ylim: Tuple[float, float],
+    ) -> None:
+        """Plot links (without `patch_kws`) as a single PathCollection
+
+        Parameters
+        ----------
+        ax : Axes
+            Matplotlib axes object to be plotted
+        links : List[Link]
+            Links to be plotted
+        track_name2offset : Dict[str, int]
+            Track name & offset dict
+        ylim: Tuple[flaot, float]
+            Min-Max y coordinatess
+        """
+        coords = np.array(
+            [
+                (
+                    link.track_start1 + track_name2offset[link.track_name1],
+                    link.track_end1 + track_name2offset[link.track_name1],
+                    link.track_start2 + track_name2offset[link.track_name2],
+                    link.track_end2 + track_name2offset[link.track_name2],
+                )
+                for link in links
+            ],
+            dtype=float,
+        )
+        start1, end1, start2, end2 = coords.T
+        size_ratio = np.array([link.size_ratio for link in links])
+        ymin, ymax = ylim[0] * size_ratio, ylim[1] * size_ratio
+        ctl_y_point1, ctl_y_point2 = ymax / 3, ymin / 3
+        # Vertices of all links are calculated by indexing x & y coordinates arrays
+        x = np.stack([start1, end1, start2, end2], axis=1)
+        y = np.stack([ymin, ymax, ctl_y_point1, ctl_y_point2], axis=1)
+        line_verts = np.stack([x[:, [2, 3, 1, 0, 2]], y[:, [0, 0, 1, 1, 0]]], axis=2)
+        curve_x_idx = [2, 3, 3, 1, 1, 0, 0, 2, 2]
+        curve_y_idx = [0, 0, 3, 2, 1, 1, 2, 3, 0]
+        curve_verts = np.stack([x[:, curve_x_idx], y[:, curve_y_idx]], axis=2)
+        paths = []
+        for i, link in enumerate(links):
+            if link.curve:
+                paths.append(Path(curve_verts[i], CURVE_PATH_CODES))
+            else:
+                paths.append(Path(line_verts[i], LINE_PATH_CODES))
+        is_zero_length = (start1 == end1) & (start2 == end2)
+        ax.add_collection(
+            PathCollection(
+                paths,
+                facecolors=[link.color for link in links],
+                edgecolors="grey",
+                linewidths=np.where(is_zero_length, 1, 0),
+            ),
+            autolim=False,
+        )
+
     def add_offset(self, track_name2offset: Dict[str, int]) -> Link:
         """Add offset to each link position
 
@@ -167,3 +270,11 @@ class Link:
         link.track_start2 += track_name2offset[self.track_name2]
         link.track_end2 += track_name2offset[self.track_name2]
         return link
+
+
+@lru_cache(maxsize=None)
+def _get_interpolation_cmap(color: str) -> colors.Colormap:
+    """Get colormap from nearly white to target color (Cached by color)"""
+    cmap = colors.LinearSegmentedColormap.from_list("m", ("white", color))
+    nearly_white = colors.to_hex(cmap(0.1))
+    return colors.LinearSegmentedColormap.from_list("m", (nearly_white, color))
@@ -1,13 +1,20 @@
+from __future__ import annotations
+
 import argparse
+import hashlib
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
-from pygenomeviz import Genbank, GenomeViz, __version__
-from pygenomeviz.align import Align, AlignCoord
+from pygenomeviz import __version__
 from pygenomeviz.scripts import get_argparser, print_args
 
+if TYPE_CHECKING:
+    from pygenomeviz import Genbank, GenomeViz
+
 
 def main():
     """Main function called from CLI"""
@@ -58,7 +65,8 @@ def run(
     format : str, optional
         Output image format (`png`|`jpg`|`svg`|`pdf`)
     reuse : bool, optional
-        If True, reuse previous result if available
+        If True, reuse cached genbank parse result & previous alignment result
+        if available (Not reused if input files or alignment options are changed)
     seqtype : str, optional
         MUMmer alignment sequence type (`protein`|`nucleotide`)
     maptype : str, optional
@@ -105,6 +113,12 @@ def run(
     GenomeViz
         _description_
     """
+    # Import heavy modules here to reduce CLI startup time (e.g. `--help`)
+    import numpy as np
+
+    from pygenomeviz import GenomeViz
+    from pygenomeviz.align import Align, AlignCoord
+
     # Check MUMmer installation
     Align.check_installation()
 
@@ -113,6 +127,9 @@ def run(
     os.makedirs(outdir, exist_ok=True)
     result_fig_file = outdir / f"result.{format}"
     align_coords_file = outdir / "align_coords.tsv"
+    align_key_file = outdir / "align_coords.key"
+    align_key = get_align_key(gbk_files, seqtype, maptype)
+    gbk_cache_dir = Path.home() / ".cache" / "pygenomeviz" / "genbank"
 
     # Set tracks & features
     gv = GenomeViz(
@@ -126,7 +143,14 @@ def run(
         tick_labelsize=tick_labelsize,
         plot_size_thr=0.0005,
     )
-    gbk_list = [Genbank(f) for f in gbk_files]
+    load_func = partial(load_genbank, cache_dir=gbk_cache_dir if reuse else None)
+    max_workers = min(len(gbk_files), os.cpu_count() or 1)
+    if max_workers <= 1:
+        # Load serially to avoid process startup & Genbank pickling overhead
+        gbk_list = [load_func(gbk_file) for gbk_file in gbk_files]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            gbk_list = list(executor.map(load_func, gbk_files))
     for gbk in gbk_list:
         track = gv.add_feature_track(gbk.name, gbk.genome_length, track_labelsize)
         track.add_genbank_features(
@@ -139,27 +163,41 @@ def run(
         )
 
     # MUMmer alignment
-    if align_coords_file.exists() and reuse:
+    has_prev_result = align_coords_file.exists()
+    is_reusable = (
+        has_prev_result
+        and align_key_file.exists()
+        and align_key_file.read_text() == align_key
+    )
+    if reuse and is_reusable:
         print("Reuse previous MUMmer result.")
         align_coords = AlignCoord.read(align_coords_file)
     else:
+        if reuse and has_prev_result:
+            print("Can't reuse previous MUMmer result due to different inputs.")
         with TemporaryDirectory() as tmpdir:
             align_coords = Align(gbk_list, tmpdir, seqtype, maptype).run()
             AlignCoord.write(align_coords, align_coords_file)
-    align_coords = AlignCoord.filter(align_coords, min_length, min_identity)
-
-    # Set links
-    min_identity = int(min([ac.identity for ac in align_coords]))
-    for ac in align_coords:
-        link1 = (ac.ref_name, ac.ref_start, ac.ref_end)
-        link2 = (ac.query_name, ac.query_start, ac.query_end)
-        gv.add_link(
-            link1,
-            link2,
+            align_key_file.write_text(align_key)
+
+    # Set links (Filtered & aggregated on structured array built once)
+    arr = AlignCoord.to_arrays(align_coords)
+    arr = AlignCoord.filter_arrays(arr, min_length, min_identity)
+    min_identity = int(arr["identity"].min()) if len(arr) > 0 else 100
+    contain_inverted_align = bool(arr["is_inverted"].any())
+    coords_names = ["ref_start", "ref_end", "query_start", "query_end"]
+    name_pairs = list(dict.fromkeys(zip(arr["ref_name"], arr["query_name"])))
+    for ref_name, query_name in name_pairs:
+        is_pair = (arr["ref_name"] == ref_name) & (arr["query_name"] == query_name)
+        pair_arr = arr[is_pair]
+        gv.add_links(
+            ref_name,
+            query_name,
+            np.stack([pair_arr[name] for name in coords_names], axis=1),
             normal_link_color,
             inverted_link_color,
             curve=curve,
-            v=ac.identity,
+            v=pair_arr["identity"],
             vmin=min_identity,
         )
 
@@ -168,7 +206,6 @@ def run(
 
     # Set colorbar
     bar_colors = [normal_link_color]
-    contain_inverted_align = any([ac.is_inverted for ac in align_coords])
     if contain_inverted_align:
         bar_colors.append(inverted_link_color)
     gv.set_colorbar(fig, bar_colors, vmin=min_identity)
@@ -180,6 +217,57 @@ def run(
     return gv
 
 
+def load_genbank(
+    gbk_file: Union[str, Path],
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Genbank:
+    """Load genbank file (Used in multiprocessing)
+
+    Parameters
+    ----------
+    gbk_file : Union[str, Path]
+        Genbank file
+    cache_dir : Optional[Union[str, Path]], optional
+        Genbank parse result cache directory
+
+    Returns
+    -------
+    gbk : Genbank
+        Genbank object
+    """
+    from pygenomeviz import Genbank
+
+    return Genbank(gbk_file, cache_dir=cache_dir)
+
+
+def get_align_key(
+    gbk_files: List[Union[str, Path]],
+    seqtype: str,
+    maptype: str,
+) -> str:
+    """Get MUMmer alignment key to check reusability of previous result
+
+    Parameters
+    ----------
+    gbk_files : List[Union[str, Path]]
+        Input genome genbank files
+    seqtype : str
+        MUMmer alignment sequence type
+    maptype : str
+        MUMmer alignment map type
+
+    Returns
+    -------
+    align_key : str
+        Alignment key hash string
+    """
+    from pygenomeviz._fingerprint import get_file_fingerprint
+
+    fingerprints = [get_file_fingerprint(f) for f in gbk_files]
+    key = "-".join(fingerprints + [seqtype, maptype])
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
 def get_args(cli_args: Optional[List[str]] = None) -> argparse.Namespace:
     """Get arguments
 
@@ -227,7 +315,7 @@ def get_args(cli_args: Optional[List[str]] = None) -> argparse.Namespace:
     )
     general_opts.add_argument(
         "--reuse",
-        help="Reuse previous result if available",
+        help="Reuse previous result if available (Not reused if inputs are changed)",
         action="store_true",
     )
     general_opts.add_argument(
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import argparse
 import csv
 import os
@@ -6,11 +8,13 @@ import shutil
 import subprocess as sp
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
-from pygenomeviz import GenomeViz, __version__
+from pygenomeviz import __version__
 from pygenomeviz.scripts import get_argparser, print_args
-from pygenomeviz.utils import ColorCycler
+
+if TYPE_CHECKING:
+    from pygenomeviz import GenomeViz
 
 
 def main():
@@ -90,6 +94,10 @@ def run(
     gv : GenomeViz
         GenomeViz instance
     """
+    # Import heavy modules here to reduce CLI startup time (e.g. `--help`)
+    from pygenomeviz import GenomeViz
+    from pygenomeviz.utils import ColorCycler
+
     # Setup output contents
     outdir = Path(outdir)
     seq_outdir = outdir / "seqfiles"
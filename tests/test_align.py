@@ -0,0 +1,39 @@
+from pygenomeviz.align import AlignCoord
+
+
+def test_filter():
+    """Test filter align coords by length & identity"""
+    align_coords = [
+        AlignCoord(1, 1000, 1, 1000, 1000, 1000, 90.0, "ref", "query"),
+        AlignCoord(1, 100, 100, 1, 100, 100, 95.0, "ref", "query"),
+        AlignCoord(1, 1000, 1000, 1, 1000, 1000, 70.0, "ref", "query"),
+    ]
+    filtered_align_coords = AlignCoord.filter(align_coords, 500, 80)
+    assert filtered_align_coords == [align_coords[0]]
+    # Check filtered align coords are copied instances
+    assert filtered_align_coords[0] is not align_coords[0]
+
+
+def test_to_arrays():
+    """Test convert align coords to structured array"""
+    align_coords = [
+        AlignCoord(1, 1000, 1, 1000, 1000, 1000, 90.0, "ref", "query"),
+        AlignCoord(1, 100, 100, 1, 100, 100, 95.0, "ref", "query"),
+    ]
+    arr = AlignCoord.to_arrays(align_coords)
+    assert len(arr) == len(align_coords)
+    assert arr["identity"].min() == 90.0
+    assert arr["is_inverted"].tolist() == [False, True]
+    assert arr["ref_name"].tolist() == ["ref", "ref"]
+    assert len(AlignCoord.to_arrays([])) == 0
+
+
+def test_filter_arrays():
+    """Test filter align coords structured array by length & identity"""
+    align_coords = [
+        AlignCoord(1, 1000, 1, 1000, 1000, 1000, 90.0, "ref", "query"),
+        AlignCoord(1, 100, 100, 1, 100, 100, 95.0, "ref", "query"),
+        AlignCoord(1, 1000, 1000, 1, 1000, 1000, 70.0, "ref", "query"),
+    ]
+    arr = AlignCoord.filter_arrays(AlignCoord.to_arrays(align_coords), 500, 80)
+    assert arr.tolist() == AlignCoord.to_arrays([align_coords[0]]).tolist()
@@ -1,9 +1,12 @@
 import math
+import sys
 from pathlib import Path
 
 import pytest
+from Bio import SeqIO
 from Bio.Seq import reverse_complement
-from pygenomeviz import Genbank
+from Bio.SeqFeature import FeatureLocation
+from pygenomeviz import Genbank, genbank
 
 
 def test_default_param(gbk_file: Path):
@@ -21,6 +24,31 @@ def test_reverse_param(gbk_file: Path):
     assert reverse_complement(normal_gbk.genome_seq) == reverse_gbk.genome_seq
 
 
+def test_complement_table():
+    """Test complement table (U is complemented as T)"""
+    seq = "ACGTURYKMSWBDHVNacgturykmswbdhvn"
+    expected_seq = reverse_complement(seq.replace("U", "T").replace("u", "t"))
+    complement_seq = seq.encode().translate(genbank._COMPLEMENT_TABLE).decode()
+    assert complement_seq[::-1] == expected_seq
+
+
+def test_reverse_attribute_change(gbk_file: Path):
+    """Test results are consistent after reverse attribute is changed"""
+    gbk = Genbank(gbk_file, reverse=False)
+    # Access cached results before change
+    gbk.extract_features()
+    gbk.calc_gc_skew()
+    gbk.calc_genome_gc_content()
+    gbk.reverse = True
+    reverse_gbk = Genbank(gbk_file, reverse=True)
+    assert gbk.genome_seq == reverse_gbk.genome_seq
+    assert str(gbk.records[0].seq) == str(reverse_gbk.records[0].seq)
+    assert [str(f.location) for f in gbk.extract_features()] == [
+        str(f.location) for f in reverse_gbk.extract_features()
+    ]
+    assert gbk.calc_gc_skew()[1].tolist() == reverse_gbk.calc_gc_skew()[1].tolist()
+
+
 def test_range_param(gbk_file: Path):
     """Test range parameter result"""
     min_range, max_range = 10000, 30000
@@ -42,10 +70,49 @@ def test_range_error_param(gbk_file: Path):
         Genbank(gbk_file, min_range=100, max_range=max_out_range)
 
 
+def test_cache_dir_param(gbk_file: Path, tmp_path: Path):
+    """Test cache_dir parameter result"""
+    cache_dir = tmp_path / "cache"
+    gbk = Genbank(gbk_file, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+    cached_gbk = Genbank(gbk_file, cache_dir=cache_dir)
+    assert gbk.genome_seq == cached_gbk.genome_seq
+    assert len(gbk.extract_features()) == len(cached_gbk.extract_features())
+
+
+def test_broken_cache_file(gbk_file: Path, tmp_path: Path):
+    """Test broken cache file is overwritten by parsed genbank records"""
+    cache_dir = tmp_path / "cache"
+    gbk = Genbank(gbk_file, cache_dir=cache_dir)
+    cache_file = next(cache_dir.glob("*.pkl"))
+    # Truncate cache file
+    cache_file.write_bytes(cache_file.read_bytes()[:100])
+    reparsed_gbk = Genbank(gbk_file, cache_dir=cache_dir)
+    assert gbk.genome_seq == reparsed_gbk.genome_seq
+    assert cache_file.stat().st_size > 100
+    cached_gbk = Genbank(gbk_file, cache_dir=cache_dir)
+    assert gbk.genome_seq == cached_gbk.genome_seq
+
+
 def test_calc_genome_gc_content(gbk_file: Path):
     """Test genome GC content calculation"""
     gbk = Genbank(gbk_file)
     assert type(gbk.calc_genome_gc_content()) == float
+    seq = gbk.genome_seq.upper()
+    expected_gc_content = 100 * (seq.count("G") + seq.count("C")) / len(seq)
+    assert gbk.calc_genome_gc_content() == pytest.approx(expected_gc_content)
+
+
+def test_range_change_after_calc(gbk_file: Path):
+    """Test results are recalculated after range is changed"""
+    min_range, max_range = 10000, 30000
+    gbk = Genbank(gbk_file)
+    gbk.calc_genome_gc_content()
+    gbk.calc_gc_skew()
+    gbk.min_range, gbk.max_range = min_range, max_range
+    range_gbk = Genbank(gbk_file, min_range=min_range, max_range=max_range)
+    assert gbk.calc_genome_gc_content() == range_gbk.calc_genome_gc_content()
+    assert gbk.calc_gc_skew()[1].tolist() == range_gbk.calc_gc_skew()[1].tolist()
 
 
 def test_calc_gc_skew(gbk_file: Path):
@@ -76,10 +143,36 @@ def test_calc_gc_content(gbk_file: Path):
     assert len(pos_list) == len(gc_content_list) == expected_count
 
 
+def test_calc_gc_window_values(gbk_file: Path):
+    """Test GC skew & GC content values in sliding window"""
+    gbk = Genbank(gbk_file)
+    window_size, step_size = 500, 250
+    pos_list, gc_skew_list = gbk.calc_gc_skew(window_size, step_size)
+    _, gc_content_list = gbk.calc_gc_content(window_size, step_size)
+    seq = gbk.genome_seq
+    for pos, gc_skew, gc_content in zip(pos_list, gc_skew_list, gc_content_list):
+        start = max(pos - int(window_size / 2), 0)
+        end = min(pos + int(window_size / 2), len(seq))
+        subseq = seq[start:end].upper()
+        g, c = subseq.count("G"), subseq.count("C")
+        assert gc_skew == pytest.approx(0.0 if g + c == 0 else (g - c) / (g + c))
+        assert gc_content == pytest.approx(100 * (g + c) / len(subseq))
+
+
 def test_extract_features(gbk_file: Path):
     """Test write cds fasta"""
     gbk = Genbank(gbk_file)
     assert len(gbk.extract_features("CDS", None, False, False)) == 60
+    # Cached result is not affected by modification of returned list
+    gbk.extract_features("CDS", None, False, False).clear()
+    assert len(gbk.extract_features("CDS", None, False, False)) == 60
+    # Cached result is not affected by modification of returned feature
+    feature = gbk.extract_features("CDS", None, False, False)[0]
+    start, end, strand = feature.location.start, feature.location.end, feature.strand
+    feature.location = FeatureLocation(0, 1, -strand)
+    feature = gbk.extract_features("CDS", None, False, False)[0]
+    assert (feature.location.start, feature.location.end) == (start, end)
+    assert feature.strand == strand
 
 
 def test_write_cds_fasta(gbk_file: Path, tmp_path: Path):
@@ -88,6 +181,8 @@ def test_write_cds_fasta(gbk_file: Path, tmp_path: Path):
     gbk = Genbank(gbk_file)
     gbk.write_cds_fasta(cds_fasta_file)
     assert cds_fasta_file.exists()
+    records = list(SeqIO.parse(cds_fasta_file, "fasta"))
+    assert len(records) == len(gbk.extract_features("CDS", None, False, False))
 
 
 def test_write_genome_fasta(gbk_file: Path, tmp_path: Path):
@@ -96,20 +191,58 @@ def test_write_genome_fasta(gbk_file: Path, tmp_path: Path):
     gbk = Genbank(gbk_file)
     gbk.write_genome_fasta(genome_fasta_file)
     assert genome_fasta_file.exists()
+    records = list(SeqIO.parse(genome_fasta_file, "fasta"))
+    assert len(records) == 1
+    assert str(records[0].seq) == gbk.genome_seq
 
 
-def test_parse_bzfile(gbk_bzfile: Path):
+@pytest.mark.parametrize("use_indexed_bzip2", [True, False])
+def test_parse_bzfile(
+    gbk_bzfile: Path, use_indexed_bzip2: bool, monkeypatch: pytest.MonkeyPatch
+):
     """Test parse genbank file (bz2 compressed)"""
+    if use_indexed_bzip2 and not genbank._INDEXED_BZIP2_AVAILABLE:
+        pytest.skip("indexed_bzip2 is not installed")
+    monkeypatch.setattr(genbank, "_INDEXED_BZIP2_AVAILABLE", use_indexed_bzip2)
     gbk = Genbank(gbk_bzfile)
     assert gbk.name == "test"
 
 
-def test_parse_gzfile(gbk_gzfile: Path):
+@pytest.mark.parametrize("use_rapidgzip", [True, False])
+def test_parse_gzfile(
+    gbk_gzfile: Path, use_rapidgzip: bool, monkeypatch: pytest.MonkeyPatch
+):
     """Test parse genbank file (gz compressed)"""
+    if use_rapidgzip and not genbank._RAPIDGZIP_AVAILABLE:
+        pytest.skip("rapidgzip is not installed")
+    monkeypatch.setattr(genbank, "_RAPIDGZIP_AVAILABLE", use_rapidgzip)
     gbk = Genbank(gbk_gzfile)
     assert gbk.name == "test"
 
 
+@pytest.mark.parametrize(
+    "module_name, flag_name",
+    [
+        ("rapidgzip", "_RAPIDGZIP_AVAILABLE"),
+        ("indexed_bzip2", "_INDEXED_BZIP2_AVAILABLE"),
+    ],
+)
+def test_broken_optional_package(
+    gbk_gzfile: Path,
+    gbk_bzfile: Path,
+    module_name: str,
+    flag_name: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test fallback if optional package is installed but failed to import"""
+    # Importing module set to None in sys.modules raises ImportError
+    monkeypatch.setitem(sys.modules, module_name, None)
+    monkeypatch.setattr(genbank, flag_name, True)
+    Genbank(gbk_gzfile)
+    Genbank(gbk_bzfile)
+    assert getattr(genbank, flag_name) is False
+
+
 def test_parse_zipfile(gbk_zipfile: Path):
     """Test parse genbank file (zip compressed)"""
     gbk = Genbank(gbk_zipfile)
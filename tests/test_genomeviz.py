@@ -67,6 +67,29 @@ def test_manual_dataset(tmp_path: Path):
     assert fig_outfile.exists()
 
 
+def test_add_links(tmp_path: Path):
+    """Test add multiple links at once"""
+    gv = GenomeViz()
+    gv.add_feature_track("genome 01", 1000)
+    gv.add_feature_track("genome 02", 1300)
+    link_coords = [(150, 300, 50, 200), (700, 500, 900, 700), (750, 950, 1150, 950)]
+    gv.add_links("genome 02", "genome 01", link_coords, v=[60, 80, 100], curve=True)
+    links = gv.get_tracks()[1].links
+    assert len(links) == len(link_coords)
+    # Check links are ordered from above track to below track
+    assert links[0].track_name1 == "genome 01"
+    assert (links[0].track_start1, links[0].track_end1) == (50, 200)
+    assert (links[0].track_start2, links[0].track_end2) == (150, 300)
+    assert [link.v for link in links] == [60, 80, 100]
+    # Check error on values length mismatch
+    with pytest.raises(ValueError):
+        gv.add_links("genome 01", "genome 02", link_coords, v=[60, 80])
+
+    result_fig_file = tmp_path / "result.png"
+    gv.savefig(result_fig_file)
+    assert result_fig_file.exists()
+
+
 def test_escherichia_phage_dataset(tmp_path: Path):
     """Test with 'escherichia phage' dataset"""
     gv = GenomeViz(
@@ -1,4 +1,7 @@
+import matplotlib.pyplot as plt
 import pytest
+from matplotlib.collections import PathCollection
+from matplotlib.patches import PathPatch
 from pygenomeviz.link import Link
 
 
@@ -72,3 +75,28 @@ def test_interpolation_value_error():
     # Case4. v > vmax
     with pytest.raises(ValueError):
         Link(*link1, *link2, v=90, vmax=80)
+
+
+def test_plot_links_order():
+    """Test links are plotted in the order they were added"""
+    link1, link2 = ("link1", 1, 100), ("link2", 101, 200)
+    patch_kws = {"hatch": "//"}
+    links = [
+        Link(*link1, *link2),
+        Link(*link1, *link2),
+        Link(*link1, *link2, patch_kws=patch_kws),
+        Link(*link1, *link2),
+        Link(*link1, *link2, patch_kws=patch_kws),
+    ]
+    fig, ax = plt.subplots()
+    Link.plot_links(ax, links, {"link1": 0, "link2": 0})
+    artists = [
+        a for a in ax.get_children() if isinstance(a, (PathCollection, PathPatch))
+    ]
+    plt.close(fig)
+
+    # Consecutive links without patch_kws are plotted as one PathCollection
+    artist_types = [type(a) for a in artists]
+    assert artist_types == [PathCollection, PathPatch, PathCollection, PathPatch]
+    collections = [a for a in artists if isinstance(a, PathCollection)]
+    assert [len(c.get_paths()) for c in collections] == [2, 1]
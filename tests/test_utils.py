@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pytest
+from pygenomeviz._fingerprint import get_file_fingerprint
 from pygenomeviz.utils import ColorCycler, load_dataset
 
 
@@ -20,6 +21,16 @@ def test_load_dataset_invalid_name_error():
     assert "dataset not found" in str(e.value)
 
 
+def test_get_file_fingerprint(tmp_path: Path):
+    """Test get_file_fingerprint"""
+    file = tmp_path / "test.txt"
+    file.write_text("test")
+    fingerprint = get_file_fingerprint(file)
+    assert fingerprint == get_file_fingerprint(file)
+    file.write_text("test modified")
+    assert fingerprint != get_file_fingerprint(file)
+
+
 def test_color_cycler():
     """Test color cycler"""
     # Check get color list length